@@ -13,7 +13,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from src.pdf_extractor import (
     extract_text_from_pdf,
-    extract_text_by_pages,
+    iter_pages,
     get_pdf_metadata
 )
 
@@ -43,11 +43,10 @@ def main():
     print(f"Total words: {len(full_text.split())}")
     print(f"\nFirst 300 characters:\n{full_text[:300]}...")
     
-    # Example 3: Extract by pages
+    # Example 3: Extract by pages (streamed, one page in memory at a time)
     print("\n📚 EXAMPLE 3: Extract Text by Pages")
     print("-" * 70)
-    pages = extract_text_by_pages(pdf_file)
-    for page in pages:
+    for page in iter_pages(pdf_file):
         print(f"Page {page['page_number']}: {page['char_count']} characters")
     
     print("\n" + "=" * 70)
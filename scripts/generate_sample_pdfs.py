@@ -9,13 +9,20 @@ from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from concurrent.futures import ProcessPoolExecutor
 import os
 
+# Paragraphs starting with these are rendered with the large title style
+_TITLE_PREFIXES = ('Sample PDF', 'Introduction to', 'Machine Learning')
+
+# Paragraphs starting with this begin a new page
+_PAGE_PREFIX = 'Page '
+
 def create_pdf_from_text(text_file, pdf_file, title="Sample PDF"):
     """Create a PDF from a text file"""
     
     # Read the text file
-    with open(text_file, 'r', encoding='utf-8') as f:
+    with open(text_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
         content = f.read()
     
     # Create PDF
@@ -35,23 +42,29 @@ def create_pdf_from_text(text_file, pdf_file, title="Sample PDF"):
     paragraphs = content.split('\n\n')
     
     for para in paragraphs:
-        if para.strip():
+        text = para.strip()
+        if text:
             # Check if it's a title or heading
-            if para.strip().startswith('Page '):
+            if text.startswith(_PAGE_PREFIX):
                 # Add page break before new pages (except first)
                 if story:
                     story.append(PageBreak())
-                story.append(Paragraph(para.strip(), styles['Heading1']))
-            elif any(para.strip().startswith(prefix) for prefix in ['Sample PDF', 'Introduction to', 'Machine Learning']):
-                story.append(Paragraph(para.strip(), title_style))
+                story.append(Paragraph(text, styles['Heading1']))
+            elif text.startswith(_TITLE_PREFIXES):
+                story.append(Paragraph(text, title_style))
             else:
-                story.append(Paragraph(para.strip(), styles['BodyText']))
+                story.append(Paragraph(text, styles['BodyText']))
             story.append(Spacer(1, 0.2*inch))
     
     # Build PDF
     doc.build(story)
     print(f"✅ Created: {pdf_file}")
 
+def create_pdf_from_text_star(pair):
+    """Unpack a (text_file, pdf_file) pair for ProcessPoolExecutor.map"""
+    text_file, pdf_file = pair
+    create_pdf_from_text(text_file, pdf_file)
+
 def main():
     """Generate all sample PDFs"""
     print("Generating sample PDF files...")
@@ -63,13 +76,19 @@ def main():
         ("data/sample_pdfs/sample2.txt", "data/sample_pdfs/sample2.pdf")
     ]
     
-    # Generate each PDF
+    # Skip samples whose text file is missing
+    available = []
     for text_file, pdf_file in samples:
         if os.path.exists(text_file):
-            create_pdf_from_text(text_file, pdf_file)
+            available.append((text_file, pdf_file))
         else:
             print(f"⚠️  Text file not found: {text_file}")
     
+    # Build the PDFs in parallel (reportlab is CPU-bound pure Python);
+    # list() surfaces any exception raised in a worker
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(create_pdf_from_text_star, available))
+    
     print("=" * 50)
     print("✅ PDF generation complete!")
 
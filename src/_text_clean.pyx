@@ -0,0 +1,64 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled Text Cleanup
+
+Optional Cython implementation of the whitespace normalization applied to
+every extracted page. pdf_extractor falls back to an equivalent regex when
+this extension has not been built.
+
+Build in place with:
+    cythonize -i src/_text_clean.pyx
+"""
+
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.unicode cimport Py_UNICODE_ISSPACE
+
+
+cdef extern from "Python.h":
+    int PyUnicode_4BYTE_KIND
+    object PyUnicode_FromKindAndData(int kind, const void *buffer, Py_ssize_t size)
+
+
+def normalize_whitespace(str s):
+    """
+    Collapse runs of whitespace into single spaces and strip both ends.
+
+    Equivalent to re.sub(r'\\s+', ' ', s).strip(), but done in one pass in
+    C without building intermediate Python objects.
+
+    Args:
+        s (str): Text to normalize
+
+    Returns:
+        str: Normalized text
+    """
+    cdef Py_ssize_t length = len(s)
+    cdef Py_ssize_t out_len = 0
+    cdef bint pending_space = False
+    cdef Py_UCS4 ch
+    cdef Py_UCS4 *buffer
+
+    if length == 0:
+        return s
+
+    buffer = <Py_UCS4 *> PyMem_Malloc(length * sizeof(Py_UCS4))
+    if buffer == NULL:
+        raise MemoryError()
+
+    try:
+        for ch in s:
+            if Py_UNICODE_ISSPACE(ch):
+                # Only emit the space once a non-space follows (drops trailing runs)
+                pending_space = out_len > 0
+                continue
+            if pending_space:
+                buffer[out_len] = ' '
+                out_len += 1
+                pending_space = False
+            buffer[out_len] = ch
+            out_len += 1
+
+        # Converts back to the narrowest string kind that fits
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, buffer, out_len)
+    finally:
+        PyMem_Free(buffer)
@@ -13,8 +13,22 @@ SUPPORTED_EXTENSIONS = ['.pdf']
 # Maximum file size in MB (default: 50MB to prevent memory issues)
 MAX_FILE_SIZE_MB = 50
 
+# PDFs smaller than this are read into memory with a single pread() call
+# (PyPDF2 backend); larger ones are memory-mapped by pool workers, while
+# cached documents are always read into memory
+ONE_SHOT_READ_BYTES = 8 * 1024 * 1024
+
+# Read buffer size used when opening PDFs with PyPDF2 (default: 1 MiB)
+READ_BUFFER_BYTES = 1 << 20
+
 # ==================== EXTRACTION SETTINGS ====================
 
+# PDF backend: 'pypdfium2' (native PDFium, much faster), 'pypdf2' (pure Python)
+# or 'crapdf' (experimental Rust extension, whole-document text only; PyPDF2 is
+# still used for metadata, encryption checks and lazy per-page access).
+# Falls back to PyPDF2 automatically if the chosen backend is not installed.
+PDF_BACKEND = 'pypdfium2'
+
 # Text encoding for extracted content
 TEXT_ENCODING = 'utf-8'
 
@@ -27,6 +41,26 @@ PRESERVE_LINE_BREAKS = True
 # Whether to remove extra whitespace from extracted text
 REMOVE_EXTRA_WHITESPACE = True
 
+# ==================== PERFORMANCE SETTINGS ====================
+
+# Number of worker processes for parallel page extraction (None = os.cpu_count())
+PARALLEL_WORKERS = None
+
+# PDFs with fewer pages than this are extracted sequentially (no process pool)
+MIN_PAGES_FOR_PARALLEL = 4
+
+# Same threshold for the native pypdfium2 backend. PDFium extracts a page in
+# well under a millisecond, so starting workers that each re-open the PDF only
+# pays off for documents above the 'small' class (> 50 pages)
+MIN_PAGES_FOR_PARALLEL_PDFIUM = 51
+
+# Number of opened PDFs kept in memory between calls on the same file
+READER_CACHE_SIZE = 8
+
+# Maximum number of files submitted per io_uring ring by extract_text_batch()
+# (also capped at half the open-file limit, since a ring's files are all open at once)
+IO_URING_QUEUE_DEPTH = 4096
+
 # ==================== LOGGING SETTINGS ====================
 
 # Log level: DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -37,6 +71,13 @@ LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
 # ==================== METADATA SETTINGS ====================
 
+# Save get_pdf_metadata() results next to each PDF ('<file>.pdf.meta.json')
+# and reuse them while the PDF's size and modification time are unchanged
+ENABLE_METADATA_SIDECAR = True
+
+# File name suffix for metadata sidecar files
+METADATA_SIDECAR_SUFFIX = '.meta.json'
+
 # List of metadata fields to extract from PDFs
 METADATA_FIELDS = [
     'title',
@@ -0,0 +1,207 @@
+"""
+io_uring Batch Loader
+
+This module reads many PDF files into memory at once using Linux io_uring,
+so a corpus of PDFs costs a few submit/wait syscalls instead of an
+open/read/close round trip per file. It is used by
+pdf_extractor.extract_text_batch().
+
+io_uring needs Linux and the optional `liburing` package. Without them,
+files are read one by one with os.pread(). pread_all() is also used by
+pdf_extractor to load small PDFs in a single call.
+"""
+
+import os
+import sys
+import logging
+from typing import Dict, List, Union
+
+from .config import IO_URING_QUEUE_DEPTH
+
+# Unix only; used to keep each ring's open files within the fd limit
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    from liburing import (
+        Ring,
+        Cqe,
+        io_uring_queue_init,
+        io_uring_queue_exit,
+        io_uring_get_sqe,
+        io_uring_prep_read,
+        io_uring_sqe_set_data64,
+        io_uring_submit,
+        io_uring_wait_cqe,
+        io_uring_cqe_seen,
+        trap_error
+    )
+except ImportError:
+    Ring = None
+
+logger = logging.getLogger(__name__)
+
+
+def io_uring_available() -> bool:
+    """Return True if io_uring can be used on this platform."""
+    return sys.platform.startswith('linux') and Ring is not None
+
+
+def _group_size() -> int:
+    """
+    Return how many files to read per ring submit.
+
+    Every file of a group is open at the same time, so the group is capped
+    at half the soft RLIMIT_NOFILE as well as IO_URING_QUEUE_DEPTH; the
+    other half is left for descriptors the process already holds.
+    """
+    if resource is None:
+        return IO_URING_QUEUE_DEPTH
+    soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft_limit == resource.RLIM_INFINITY:
+        return IO_URING_QUEUE_DEPTH
+    return max(1, min(IO_URING_QUEUE_DEPTH, soft_limit // 2))
+
+
+def pread_all(fd: int, size: int, offset: int = 0) -> bytes:
+    """
+    Read size bytes from an open file descriptor with os.pread().
+
+    Short reads are retried until size bytes are read or end of file is
+    reached. The descriptor's file offset is not changed.
+
+    Args:
+        fd (int): Open file descriptor
+        size (int): Number of bytes to read
+        offset (int): Position in the file to start reading from
+
+    Returns:
+        bytes: The data read (shorter than size only at end of file)
+    """
+    chunks = []
+    while size > 0:
+        chunk = os.pread(fd, size, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+        offset += len(chunk)
+    return b''.join(chunks)
+
+
+def _read_file(path: str) -> Union[bytes, OSError]:
+    """Read a whole file with positional reads (fallback path), returning the error on failure."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return pread_all(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        return e
+
+
+def _read_group(ring, cqe, paths: List[str]) -> Dict[str, Union[bytes, OSError]]:
+    """
+    Read up to one ring's worth of files with a single submit.
+
+    A file that cannot be opened or read (e.g. a directory, EISDIR) is
+    mapped to its OSError instead of failing the whole group.
+    """
+    results = {}
+    fds = {}
+    buffers = {}
+    try:
+        for index, path in enumerate(paths):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                fds[index] = fd
+                # Buffer sized from the stat, so each file is read in one request
+                buffers[index] = bytearray(os.fstat(fd).st_size)
+            except OSError as e:
+                results[path] = e
+                continue
+
+            sqe = io_uring_get_sqe(ring)
+            io_uring_prep_read(sqe, fd, buffers[index], 0)
+            io_uring_sqe_set_data64(sqe, index)
+
+        if buffers:
+            io_uring_submit(ring)
+
+        for _ in range(len(buffers)):
+            io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            index = entry.user_data
+            buffer = buffers.pop(index)
+            try:
+                # Negative (errno) results are raised as OSError
+                nbytes = trap_error(entry.res)
+                data = bytes(buffer[:nbytes])
+                if nbytes < len(buffer):
+                    # Short read: fetch the remainder synchronously
+                    data += pread_all(fds[index], len(buffer) - nbytes, nbytes)
+            except OSError as e:
+                data = e
+            finally:
+                io_uring_cqe_seen(ring, entry)
+            results[paths[index]] = data
+        return results
+    finally:
+        for fd in fds.values():
+            os.close(fd)
+
+
+def batch_read_pdfs(paths: List[str]) -> Dict[str, Union[bytes, OSError]]:
+    """
+    Read the full contents of several files.
+
+    On Linux with liburing installed, the reads for up to
+    IO_URING_QUEUE_DEPTH files (fewer if the open-file limit is lower) are
+    submitted together through one io_uring ring. Otherwise, or if the kernel refuses to create the ring, each file
+    is read with os.pread().
+
+    Args:
+        paths (List[str]): Files to read
+
+    Returns:
+        Dict[str, Union[bytes, OSError]]: File contents keyed by path. A
+            file that cannot be opened or read maps to the OSError instead,
+            so one bad path does not fail the rest of the batch.
+
+    Raises:
+        OSError: If the io_uring ring itself fails
+
+    Example:
+        >>> blobs = batch_read_pdfs(["a.pdf", "b.pdf"])
+        >>> print(len(blobs["a.pdf"]))
+    """
+    # Duplicate paths would otherwise be read twice
+    paths = list(dict.fromkeys(paths))
+
+    if not paths:
+        return {}
+
+    if not io_uring_available():
+        return {path: _read_file(path) for path in paths}
+
+    group_size = _group_size()
+    ring = Ring()
+    cqe = Cqe()
+    try:
+        io_uring_queue_init(min(len(paths), group_size), ring)
+    except OSError as e:
+        # e.g. io_uring disabled by the kernel or a seccomp policy
+        logger.warning(f"io_uring unavailable, falling back to pread: {e}")
+        return {path: _read_file(path) for path in paths}
+
+    try:
+        results = {}
+        for start in range(0, len(paths), group_size):
+            results.update(_read_group(ring, cqe, paths[start:start + group_size]))
+        logger.info(f"Read {len(results)} files with io_uring")
+        return results
+    finally:
+        io_uring_queue_exit(ring)
@@ -7,16 +7,48 @@ It serves as the foundation for the RAG-based Question Answering system.
 Main Functions:
 - extract_text_from_pdf(file_path): Extract all text from a PDF
 - extract_text_by_pages(file_path): Extract text page-by-page
+- iter_pages(file_path): Stream text page-by-page
+- extract_text_batch(file_paths): Extract all text from many PDFs
 - get_pdf_metadata(file_path): Get PDF metadata information
+- clear_cache(): Release documents cached between calls
+
+Errors from unreadable or malformed PDFs are raised as PDFExtractionError.
 
 Author: RAG PDF QA System
 Version: 0.1.0
 """
 
+import io
 import os
+import re
+import json
+import mmap
+import zlib
+import struct
 import logging
-from typing import List, Dict, Optional
+import functools
+import threading
+from contextlib import nullcontext
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Iterator, Optional, Union
 from PyPDF2 import PdfReader
+from PyPDF2.errors import PdfReadError
+
+# pypdfium2 is an optional native (PDFium) backend; fall back to PyPDF2 without it
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:
+    pdfium = None
+    pdfium_c = None
+
+# crapdf is an experimental Rust extension that only extracts page text
+try:
+    import crapdf
+except ImportError:
+    crapdf = None
 
 # Import configuration settings
 from .config import (
@@ -28,30 +60,462 @@ from .config import (
     REMOVE_EXTRA_WHITESPACE,
     LOG_LEVEL,
     LOG_FORMAT,
-    METADATA_FIELDS
+    METADATA_FIELDS,
+    PDF_BACKEND,
+    PARALLEL_WORKERS,
+    READER_CACHE_SIZE,
+    ENABLE_METADATA_SIDECAR,
+    METADATA_SIDECAR_SUFFIX,
+    READ_BUFFER_BYTES,
+    ONE_SHOT_READ_BYTES
 )
+from .strategy import Strategy, STREAM_CHUNK_SIZE, choose_strategy
+from .io_uring_loader import batch_read_pdfs, io_uring_available, pread_all
 
 # Configure logging
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# Errors raised by the PDF backends for unreadable or malformed files.
+# pypdfium2's PdfiumError and crapdf's errors are RuntimeError subclasses.
+# PyPDF2 often fails on damaged files with plain Python errors instead of
+# PdfReadError (e.g. struct.error from a corrupt ASCII85 stream, zlib.error
+# from bad Flate data, KeyError for a missing dictionary entry).
+_BACKEND_ERRORS = (PdfReadError, OSError, RuntimeError, struct.error, zlib.error,
+                   KeyError, IndexError, TypeError)
+
+
+class PDFExtractionError(Exception):
+    """Raised when a PDF cannot be read or parsed by the backend."""
+
+
+# Runs of whitespace, collapsed to a single space when REMOVE_EXTRA_WHITESPACE is set
+_WS_RE = re.compile(r'\s+')
+
+# Compiled (Cython) whitespace cleanup if built, otherwise the equivalent regex
+try:
+    from ._text_clean import normalize_whitespace as _normalize_whitespace
+except ImportError:
+    def _normalize_whitespace(text: str) -> str:
+        """Collapse runs of whitespace into single spaces and strip both ends."""
+        return _WS_RE.sub(' ', text).strip()
+
+# (field, document info key) pairs, e.g. ('creation_date', '/CreationDate'),
+# precomputed so get_pdf_metadata does no per-call string work
+_PDF_META_KEYS = tuple((field, f'/{field.title().replace("_", "")}') for field in METADATA_FIELDS)
+
+
+def _use_pdfium() -> bool:
+    """Return True if the pypdfium2 backend is configured and installed."""
+    return PDF_BACKEND == 'pypdfium2' and pdfium is not None
+
+
+def _use_crapdf() -> bool:
+    """Return True if the crapdf text backend is configured and installed."""
+    return PDF_BACKEND == 'crapdf' and crapdf is not None
+
+
+def _open_pdf_stream(file_path: str, use_mmap: bool = False):
+    """
+    Return a read-only stream over the PDF for PyPDF2.
+    
+    Files are read with a single pread() into memory, skipping the buffered
+    I/O layer. With use_mmap, files of ONE_SHOT_READ_BYTES or more are
+    memory-mapped instead, so pages are faulted in by the kernel on demand
+    instead of being copied into a Python bytes object; the map is unmapped
+    when the reader that owns it is collected. Filesystems that do not
+    support mmap fall back to a buffered file object.
+    
+    Only pass use_mmap for readers that are dropped when the current call
+    returns: touching a map after the file was truncated kills the process
+    with SIGBUS, which no except clause can catch. Cached readers (and the
+    LazyPage objects holding them) can outlive the file, so they always get
+    an in-memory copy (files are capped at MAX_FILE_SIZE_MB).
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if not use_mmap or size < ONE_SHOT_READ_BYTES:
+            return io.BytesIO(pread_all(fd, size))
+        try:
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            pass
+    finally:
+        # Neither the bytes nor the map need the descriptor to stay open
+        os.close(fd)
+    # PyPDF2 parses with many small seeks/reads; a large buffer serves
+    # most of them from memory instead of the default 8KB one
+    return open(file_path, 'rb', buffering=READ_BUFFER_BYTES)
+
+
+# PDFium is not thread-safe, not even for different documents, so every call
+# into it (open, page access, extraction) is serialized through one lock
+_PDFIUM_LOCK = threading.RLock()
+
+
+def _document_lock(doc):
+    """
+    Return the lock to hold while using an opened document.
+    
+    PyPDF2 documents only need protecting from threads using the same
+    document, so each gets its own lock; all PDFium documents share
+    _PDFIUM_LOCK.
+    """
+    if isinstance(doc, PdfReader):
+        return threading.RLock()
+    return _PDFIUM_LOCK
+
+
+def _open_pdfium(source):
+    """Open a path or in-memory PDF with pypdfium2, mapping password errors to ValueError."""
+    try:
+        with _PDFIUM_LOCK:
+            return pdfium.PdfDocument(source)
+    except pdfium.PdfiumError as e:
+        # PDFium refuses to open encrypted files without the password
+        if getattr(e, 'err_code', None) == pdfium_c.FPDF_ERR_PASSWORD:
+            raise ValueError("Cannot extract text from encrypted PDF. Please decrypt first.")
+        raise
+
+
+def _open_pdf(file_path: str, use_mmap: bool = False):
+    """
+    Open a PDF with the configured backend.
+    
+    Args:
+        file_path (str): Path to the PDF file
+        use_mmap (bool): Let PyPDF2 read large files through mmap; only for
+            documents that are not kept after the call (see _open_pdf_stream)
+        
+    Returns:
+        pdfium.PdfDocument or PdfReader: The opened document
+        
+    Raises:
+        ValueError: If the PDF is password-protected (pypdfium2 backend)
+    """
+    if not _use_pdfium():
+        return PdfReader(_open_pdf_stream(file_path, use_mmap))
+    return _open_pdfium(file_path)
+
+
+def _open_pdf_bytes(data: bytes):
+    """Open a PDF already read into memory with the configured backend."""
+    if not _use_pdfium():
+        return PdfReader(io.BytesIO(data))
+    return _open_pdfium(data)
+
+
+@functools.lru_cache(maxsize=READER_CACHE_SIZE)
+def _get_reader(file_path: str, mtime: float):
+    """
+    Return an opened document and its lock, reusing them across calls on the same file.
+    
+    The file's modification time is part of the cache key, so a file that
+    changes on disk is re-opened instead of served stale.
+    
+    The cached document is shared by every thread that opens the file, and
+    neither backend is safe to use from two threads at once (PyPDF2 shares
+    one stream position, PDFium is not thread-safe at all). Hold the
+    returned lock (see _document_lock) around every access to the document.
+    """
+    doc = _open_pdf(file_path)
+    return doc, _document_lock(doc)
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached PDF documents.
+    
+    Cached documents keep their files open; call this to release them
+    (e.g. before deleting or replacing a processed PDF).
+    """
+    # Dropped PDFium documents are closed through PDFium as well
+    with _PDFIUM_LOCK:
+        _get_reader.cache_clear()
+
+
+def _is_encrypted(doc) -> bool:
+    """Return True if the opened document uses a security handler."""
+    if isinstance(doc, PdfReader):
+        return doc.is_encrypted
+    return pdfium_c.FPDF_GetSecurityHandlerRevision(doc) != -1
+
+
+def _get_page_count(doc) -> int:
+    """Return the number of pages in an opened document."""
+    if isinstance(doc, PdfReader):
+        return len(doc.pages)
+    return len(doc)
+
+
+def _get_declared_page_count(doc) -> int:
+    """
+    Return the page count without walking the page tree.
+    
+    PyPDF2's len(reader.pages) flattens the whole page tree; for metadata we
+    read the root /Pages /Count entry instead (PDFium's page count already
+    comes from the catalog). Falls back to counting pages if /Count is
+    missing or malformed.
+    """
+    if not isinstance(doc, PdfReader):
+        return len(doc)
+    
+    try:
+        return int(doc.trailer['/Root']['/Pages']['/Count'])
+    except (KeyError, TypeError, ValueError):
+        return len(doc.pages)
+
+
+def _extract_page_text(doc, page_index: int) -> str:
+    """
+    Extract the raw text of a single page (0-indexed).
+    
+    For pypdfium2 the text is read natively by PDFium and the page/textpage
+    handles are closed immediately to keep memory flat.
+    """
+    if isinstance(doc, PdfReader):
+        return doc.pages[page_index].extract_text()
+    
+    page = doc[page_index]
+    textpage = page.get_textpage()
+    try:
+        return textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
+
+
+def _clean_page_text(page_text: str) -> str:
+    """Apply the configured text processing to a page's raw text."""
+    if REMOVE_EXTRA_WHITESPACE:
+        page_text = _normalize_whitespace(page_text)
+    return page_text
+
+
+def _make_page_data(page_index: int, raw_text: str) -> Dict[str, any]:
+    """Clean a page's raw text (0-indexed page) into the public page dictionary."""
+    page_text = _clean_page_text(raw_text)
+    return {
+        'page_number': page_index + 1,
+        'text': page_text,
+        'char_count': len(page_text)
+    }
+
+
+def _build_page_data(doc, page_index: int) -> Dict[str, any]:
+    """Extract and clean one page (0-indexed) into the public page dictionary."""
+    return _make_page_data(page_index, _extract_page_text(doc, page_index))
+
+
+def _extract_rust(source: Union[str, bytes]) -> List[str]:
+    """Extract the raw text of every page of a path or in-memory PDF with crapdf."""
+    if isinstance(source, bytes):
+        return crapdf.extract_bytes(source)
+    return crapdf.extract(source)
+
+
+def _extract_rust_pages(source: Union[str, bytes], num_pages: int) -> Optional[Iterator[Dict[str, any]]]:
+    """
+    Extract all pages with crapdf as page dictionaries.
+    
+    Returns None if crapdf disagrees with the backend about the page count,
+    so the caller can fall back to per-page extraction.
+    """
+    page_texts = _extract_rust(source)
+    if len(page_texts) != num_pages:
+        logger.warning(f"crapdf returned {len(page_texts)} of {num_pages} pages, falling back")
+        return None
+    return (_make_page_data(index, text) for index, text in enumerate(page_texts))
+
+
+class LazyPage:
+    """
+    A PDF page whose text is only extracted when first accessed.
+    
+    Returned by extract_text_by_pages(file_path, lazy=True). Supports the
+    same keys as the regular page dictionaries (page['text'], ...), so it
+    can be used in their place.
+    
+    Attributes:
+        page_number (int): Page number (1-indexed)
+        text (str): Extracted text, computed on first access and cached
+        char_count (int): Number of characters on the page
+    """
+    
+    _KEYS = ('page_number', 'text', 'char_count')
+    
+    def __init__(self, doc, page_num: int, lock=None):
+        self._doc = doc
+        self._lock = lock if lock is not None else nullcontext()
+        self.page_number = page_num
+    
+    @cached_property
+    def text(self) -> str:
+        try:
+            with self._lock:
+                raw_text = _extract_page_text(self._doc, self.page_number - 1)
+        except _BACKEND_ERRORS as e:
+            raise PDFExtractionError(f"Failed to extract page {self.page_number}: {e}") from e
+        return _clean_page_text(raw_text)
+    
+    @property
+    def char_count(self) -> int:
+        return len(self.text)
+    
+    def __getitem__(self, key: str):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __repr__(self) -> str:
+        return f"LazyPage(page_number={self.page_number})"
+
+
+# Document opened once per worker process by _init_worker
+_worker_doc = None
+
+
+def _init_worker(file_path: str) -> None:
+    """
+    Process pool initializer: open the PDF once for all pages a worker handles.
+    
+    Deliberately bypasses _get_reader: a cached document inherited from the
+    parent through fork() would share its file offset with the other workers.
+    """
+    global _worker_doc
+    _worker_doc = (file_path, _open_pdf(file_path, use_mmap=True))
+
+
+def _extract_page(file_path: str, page_index: int) -> Dict[str, any]:
+    """
+    Extract a single page in a worker process.
+    
+    Kept at module level so it can be pickled by ProcessPoolExecutor.
+    Reuses the document opened by _init_worker instead of re-parsing the PDF.
+    """
+    if _worker_doc is not None and _worker_doc[0] == file_path:
+        doc = _worker_doc[1]
+    else:
+        doc = _open_pdf(file_path, use_mmap=True)
+    return _build_page_data(doc, page_index)
+
+
+def _extract_sequential(doc, num_pages: int, lock=None) -> Iterator[Dict[str, any]]:
+    """
+    Extract pages one after another in the current process.
+    
+    If a lock is given (see _document_lock), it is held while each page is
+    read but not across yields, so other threads can use the document
+    between pages.
+    """
+    if lock is None:
+        lock = nullcontext()
+    for page_num in range(1, num_pages + 1):
+        # %-style args: the message is only formatted if DEBUG is enabled
+        logger.debug("Extracting text from page %d/%d", page_num, num_pages)
+        with lock:
+            raw_text = _extract_page_text(doc, page_num - 1)
+        yield _make_page_data(page_num - 1, raw_text)
+
+
+def _extract_windowed(file_path: str, num_pages: int, max_workers: int,
+                      window: int, chunksize: int) -> Iterator[Dict[str, any]]:
+    """
+    Extract pages in a process pool one window of pages at a time.
+    
+    Only one window is in flight at once, so a slow consumer (e.g. one
+    embedding each page) holds at most a window of finished pages, however
+    long the document is.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(file_path,)) as executor:
+        for start in range(0, num_pages, window):
+            stop = min(start + window, num_pages)
+            # map() yields results in submission order, i.e. sorted by page number
+            yield from executor.map(_extract_page, repeat(file_path), range(start, stop),
+                                    chunksize=chunksize)
+
+
+def _extract_pooled(file_path: str, num_pages: int, strategy: Strategy) -> Iterator[Dict[str, any]]:
+    """
+    Extract pages in a process pool, up to batch_size pages per task.
+    
+    Pages are submitted in STREAM_CHUNK_SIZE windows like 'stream' mode,
+    with tasks shrunk so every worker gets one per window.
+    """
+    chunksize = max(1, min(strategy.batch_size, STREAM_CHUNK_SIZE // strategy.max_workers))
+    return _extract_windowed(file_path, num_pages, strategy.max_workers,
+                             STREAM_CHUNK_SIZE, chunksize)
+
 
-def validate_pdf_file(file_path: str) -> bool:
+def _extract_streaming(file_path: str, num_pages: int, strategy: Strategy) -> Iterator[Dict[str, any]]:
+    """Extract pages in a process pool one window of batch_size pages at a time."""
+    chunksize = max(1, strategy.batch_size // (strategy.max_workers * 4))
+    return _extract_windowed(file_path, num_pages, strategy.max_workers,
+                             strategy.batch_size, chunksize)
+
+
+def _extract_pages(file_path: str, doc, lock, num_pages: int) -> Iterator[Dict[str, any]]:
+    """
+    Extract every page of an opened document, yielding pages in order.
+    
+    The extraction strategy is picked from the page count and available
+    workers (see src/strategy.py): small documents stay in-process, larger
+    ones are spread across a process pool. With the 'crapdf' backend the
+    whole document is extracted natively in one call instead. The lock
+    guards the shared document on the in-process path.
+    """
+    if _use_crapdf():
+        pages = _extract_rust_pages(file_path, num_pages)
+        if pages is not None:
+            return pages
+    
+    strategy = choose_strategy(num_pages, PARALLEL_WORKERS or os.cpu_count(), native=_use_pdfium())
+    logger.info(f"Using '{strategy.name}' strategy ({strategy.mode}) for {num_pages} pages")
+    
+    if strategy.mode == 'sequential':
+        return _extract_sequential(doc, num_pages, lock)
+    if strategy.mode == 'stream':
+        return _extract_streaming(file_path, num_pages, strategy)
+    # 'batch' and 'process' differ only in worker count and task size
+    return _extract_pooled(file_path, num_pages, strategy)
+
+
+def _iter_pages_text(file_path: str, doc, lock, num_pages: int) -> Iterator[str]:
+    """Yield the cleaned text of each page, in page order."""
+    for page_data in _extract_pages(file_path, doc, lock, num_pages):
+        yield page_data['text']
+
+
+def _get_raw_metadata(doc) -> Optional[Dict[str, any]]:
+    """Return the document info dictionary keyed PyPDF2-style ('/Title', ...)."""
+    if isinstance(doc, PdfReader):
+        return doc.metadata
+    return {f'/{key}': value for key, value in doc.get_metadata_dict(skip_empty=True).items()}
+
+
+def validate_pdf_file(file_path: str) -> os.stat_result:
     """
     Validate that the file exists, is a PDF, and meets size requirements.
     
+    The file is stat'ed only once; the result is returned so callers can
+    reuse st_size/st_mtime instead of hitting the filesystem again.
+    
     Args:
         file_path (str): Path to the PDF file
         
     Returns:
-        bool: True if file is valid, raises exception otherwise
+        os.stat_result: The file's stat result if valid, raises exception otherwise
         
     Raises:
         FileNotFoundError: If file doesn't exist
         ValueError: If file is not a PDF or exceeds size limit
     """
-    # Check if file exists
-    if not os.path.exists(file_path):
+    # Check if file exists (any stat failure is reported as missing, like os.path.exists)
+    try:
+        st = os.stat(file_path)
+    except (OSError, ValueError):
         raise FileNotFoundError(f"File not found: {file_path}")
     
     # Check file extension
@@ -60,12 +524,12 @@ def validate_pdf_file(file_path: str) -> bool:
         raise ValueError(f"Unsupported file type: {file_ext}. Expected PDF file.")
     
     # Check file size
-    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+    file_size_mb = st.st_size / (1024 * 1024)
     if file_size_mb > MAX_FILE_SIZE_MB:
         raise ValueError(f"File size ({file_size_mb:.2f}MB) exceeds maximum allowed size ({MAX_FILE_SIZE_MB}MB)")
     
     logger.info(f"File validation passed: {file_path}")
-    return True
+    return st
 
 
 def extract_text_from_pdf(file_path: str) -> str:
@@ -85,7 +549,7 @@ def extract_text_from_pdf(file_path: str) -> str:
     Raises:
         FileNotFoundError: If the PDF file doesn't exist
         ValueError: If the file is invalid or encrypted
-        Exception: For other PDF reading errors
+        PDFExtractionError: If the PDF cannot be read or parsed
         
     Example:
         >>> text = extract_text_from_pdf("documents/sample.pdf")
@@ -93,35 +557,26 @@ def extract_text_from_pdf(file_path: str) -> str:
     """
     try:
         # Validate the file first
-        validate_pdf_file(file_path)
+        st = validate_pdf_file(file_path)
         
         # Open and read the PDF
         logger.info(f"Opening PDF file: {file_path}")
-        reader = PdfReader(file_path)
-        
-        # Check if PDF is encrypted
-        if reader.is_encrypted:
-            logger.warning(f"PDF is encrypted: {file_path}")
-            raise ValueError("Cannot extract text from encrypted PDF. Please decrypt first.")
-        
-        # Extract text from all pages
-        num_pages = len(reader.pages)
-        logger.info(f"PDF has {num_pages} pages")
+        doc, lock = _get_reader(file_path, st.st_mtime)
         
-        all_text = []
-        for page_num, page in enumerate(reader.pages, start=1):
-            logger.debug(f"Extracting text from page {page_num}/{num_pages}")
-            page_text = page.extract_text()
-            
-            # Apply text processing based on config
-            if REMOVE_EXTRA_WHITESPACE:
-                page_text = ' '.join(page_text.split())
+        with lock:
+            # Check if PDF is encrypted
+            if _is_encrypted(doc):
+                logger.warning(f"PDF is encrypted: {file_path}")
+                raise ValueError("Cannot extract text from encrypted PDF. Please decrypt first.")
             
-            all_text.append(page_text)
+            # Extract text from all pages
+            num_pages = _get_page_count(doc)
+        logger.info(f"PDF has {num_pages} pages")
         
-        # Join all pages with line break or space
+        # Join all pages with line break or space, straight from the page
+        # generator so no parallel list of page texts is kept around
         separator = '\n\n' if PRESERVE_LINE_BREAKS else ' '
-        combined_text = separator.join(all_text)
+        combined_text = separator.join(_iter_pages_text(file_path, doc, lock, num_pages))
         
         logger.info(f"Successfully extracted {len(combined_text)} characters from {num_pages} pages")
         return combined_text
@@ -132,23 +587,79 @@ def extract_text_from_pdf(file_path: str) -> str:
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         raise
-    except Exception as e:
+    except _BACKEND_ERRORS as e:
         logger.error(f"Error extracting text from PDF: {e}")
-        raise Exception(f"Failed to extract text: {str(e)}")
+        raise PDFExtractionError(f"Failed to extract text: {e}") from e
+
+
+def iter_pages(file_path: str) -> Iterator[Dict[str, any]]:
+    """
+    Extract text from a PDF one page at a time.
+    
+    Pages are yielded as soon as they are extracted, so only the current
+    page has to be held in memory. Prefer this over extract_text_by_pages()
+    for large documents that are processed page by page.
+    
+    Args:
+        file_path (str): Path to the PDF file
+        
+    Yields:
+        Dict: One dictionary per page, in page order, containing:
+            - 'page_number': Page number (1-indexed)
+            - 'text': Extracted text from that page
+            - 'char_count': Number of characters on the page
+            
+    Example:
+        >>> for page in iter_pages("documents/sample.pdf"):
+        ...     print(f"Page {page['page_number']}: {page['char_count']} chars")
+    """
+    try:
+        # Validate the file first
+        st = validate_pdf_file(file_path)
+        
+        # Open and read the PDF
+        logger.info(f"Opening PDF file for page-by-page extraction: {file_path}")
+        doc, lock = _get_reader(file_path, st.st_mtime)
+        
+        with lock:
+            # Check if PDF is encrypted
+            if _is_encrypted(doc):
+                logger.warning(f"PDF is encrypted: {file_path}")
+                raise ValueError("Cannot extract text from encrypted PDF. Please decrypt first.")
+            
+            num_pages = _get_page_count(doc)
+        
+        # Extract text page by page
+        yield from _extract_pages(file_path, doc, lock, num_pages)
+        
+        logger.info(f"Successfully extracted text from {num_pages} pages")
+        
+    except (FileNotFoundError, ValueError) as e:
+        logger.error(f"Error: {e}")
+        raise
+    except _BACKEND_ERRORS as e:
+        logger.error(f"Error extracting text by pages: {e}")
+        raise PDFExtractionError(f"Failed to extract text by pages: {e}") from e
 
 
-def extract_text_by_pages(file_path: str) -> List[Dict[str, any]]:
+def extract_text_by_pages(file_path: str, lazy: bool = False) -> List[Union[Dict[str, any], LazyPage]]:
     """
     Extract text from a PDF with page-level granularity.
     
     This function returns text separated by pages, which is useful for
     maintaining document structure and creating page-specific embeddings.
+    All pages are held in memory; use iter_pages() to stream them instead.
+    
+    With lazy=True, no text is extracted up front: LazyPage objects are
+    returned and each page is only extracted when its text is accessed.
+    This is much cheaper when only a few pages are needed (e.g. previews).
     
     Args:
         file_path (str): Path to the PDF file
+        lazy (bool): Return LazyPage objects instead of extracting every page
         
     Returns:
-        List[Dict]: List of dictionaries, each containing:
+        List[Dict]: List of dictionaries (or LazyPage objects), each containing:
             - 'page_number': Page number (1-indexed)
             - 'text': Extracted text from that page
             - 'char_count': Number of characters on the page
@@ -157,63 +668,195 @@ def extract_text_by_pages(file_path: str) -> List[Dict[str, any]]:
         >>> pages = extract_text_by_pages("documents/sample.pdf")
         >>> for page in pages:
         ...     print(f"Page {page['page_number']}: {page['char_count']} chars")
+        >>> first = extract_text_by_pages("documents/sample.pdf", lazy=True)[0]
+        >>> print(first.text[:100])
     """
+    if not lazy:
+        return list(iter_pages(file_path))
+    
     try:
         # Validate the file first
-        validate_pdf_file(file_path)
+        st = validate_pdf_file(file_path)
         
         # Open and read the PDF
-        logger.info(f"Opening PDF file for page-by-page extraction: {file_path}")
-        reader = PdfReader(file_path)
-        
-        # Check if PDF is encrypted
-        if reader.is_encrypted:
-            logger.warning(f"PDF is encrypted: {file_path}")
-            raise ValueError("Cannot extract text from encrypted PDF. Please decrypt first.")
-        
-        # Extract text page by page
-        pages_data = []
-        num_pages = len(reader.pages)
+        logger.info(f"Opening PDF file for lazy page extraction: {file_path}")
+        doc, lock = _get_reader(file_path, st.st_mtime)
         
-        for page_num, page in enumerate(reader.pages, start=1):
-            logger.debug(f"Processing page {page_num}/{num_pages}")
-            
-            # Extract text from current page
-            page_text = page.extract_text()
+        with lock:
+            # Check if PDF is encrypted
+            if _is_encrypted(doc):
+                logger.warning(f"PDF is encrypted: {file_path}")
+                raise ValueError("Cannot extract text from encrypted PDF. Please decrypt first.")
             
-            # Apply text processing
-            if REMOVE_EXTRA_WHITESPACE:
-                page_text = ' '.join(page_text.split())
-            
-            # Create page data dictionary
-            page_data = {
-                'page_number': page_num,
-                'text': page_text,
-                'char_count': len(page_text)
-            }
-            
-            pages_data.append(page_data)
-        
-        logger.info(f"Successfully extracted text from {num_pages} pages")
-        return pages_data
+            num_pages = _get_page_count(doc)
+        return [LazyPage(doc, page_num, lock) for page_num in range(1, num_pages + 1)]
         
     except (FileNotFoundError, ValueError) as e:
         logger.error(f"Error: {e}")
         raise
-    except Exception as e:
+    except _BACKEND_ERRORS as e:
         logger.error(f"Error extracting text by pages: {e}")
-        raise Exception(f"Failed to extract text by pages: {str(e)}")
+        raise PDFExtractionError(f"Failed to extract text by pages: {e}") from e
+
+
+def _extract_text_from_bytes(file_path: str, data: bytes) -> str:
+    """
+    Extract all text from a PDF already read into memory.
+    
+    Raises:
+        ValueError: If the PDF is encrypted
+        PDFExtractionError: If the PDF cannot be read or parsed
+    """
+    try:
+        doc = _open_pdf_bytes(data)
+        # Not cached, but PDFium documents still share the global lock
+        lock = _document_lock(doc)
+        
+        with lock:
+            if _is_encrypted(doc):
+                logger.warning(f"PDF is encrypted: {file_path}")
+                raise ValueError("Cannot extract text from encrypted PDF. Please decrypt first.")
+            
+            num_pages = _get_page_count(doc)
+        
+        # Documents are parsed from memory, so pages are read in-process
+        pages = _extract_rust_pages(data, num_pages) if _use_crapdf() else None
+        if pages is None:
+            pages = _extract_sequential(doc, num_pages, lock)
+        
+        separator = '\n\n' if PRESERVE_LINE_BREAKS else ' '
+        return separator.join(page_data['text'] for page_data in pages)
+        
+    except _BACKEND_ERRORS as e:
+        raise PDFExtractionError(f"Failed to extract text: {e}") from e
 
 
-def get_pdf_metadata(file_path: str) -> Dict[str, any]:
+def extract_text_batch(file_paths: List[str]) -> Dict[str, str]:
+    """
+    Extract all text from many PDF files at once.
+    
+    Intended for ingesting a whole corpus: on Linux the files are read into
+    memory together through io_uring (see src/io_uring_loader.py) and each
+    document is then parsed from memory. Elsewhere, each file goes through
+    extract_text_from_pdf().
+    
+    All paths are validated up front. A PDF that then turns out to be
+    encrypted, unreadable or corrupted does not stop the batch: it is
+    logged and left out of the result.
+    
+    Args:
+        file_paths (List[str]): Paths to the PDF files
+        
+    Returns:
+        Dict[str, str]: Extracted text keyed by file path
+        
+    Raises:
+        FileNotFoundError: If a PDF file doesn't exist
+        ValueError: If a file is not a PDF or exceeds the size limit
+        PDFExtractionError: If the batch read itself fails (individual
+            unreadable files are skipped)
+        
+    Example:
+        >>> texts = extract_text_batch(["a.pdf", "b.pdf"])
+        >>> print(f"Extracted {len(texts['a.pdf'])} characters from a.pdf")
+    """
+    try:
+        # Validate every file before reading any of them
+        for file_path in file_paths:
+            validate_pdf_file(file_path)
+        
+        blobs = None
+        if io_uring_available():
+            logger.info(f"Reading {len(file_paths)} PDF files")
+            blobs = batch_read_pdfs(file_paths)
+        
+        unique_paths = list(dict.fromkeys(file_paths))
+        results = {}
+        for file_path in unique_paths:
+            try:
+                if blobs is None:
+                    results[file_path] = extract_text_from_pdf(file_path)
+                else:
+                    data = blobs[file_path]
+                    if isinstance(data, OSError):
+                        raise PDFExtractionError(f"Failed to read PDF: {data}") from data
+                    results[file_path] = _extract_text_from_bytes(file_path, data)
+            except (FileNotFoundError, ValueError, PDFExtractionError) as e:
+                # One bad PDF should not abort a whole corpus ingestion; parse
+                # failures arrive as PDFExtractionError, encrypted files as
+                # ValueError, and files deleted since validation as FileNotFoundError
+                logger.error(f"Skipping {file_path}: {e}")
+        
+        logger.info(f"Successfully extracted text from {len(results)} of {len(unique_paths)} PDF files")
+        return results
+        
+    except FileNotFoundError as e:
+        logger.error(f"File not found: {e}")
+        raise
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise
+    except OSError as e:
+        logger.error(f"Error reading PDF batch: {e}")
+        raise PDFExtractionError(f"Failed to read PDF batch: {e}") from e
+
+
+def _load_metadata_sidecar(file_path: str, file_size: int, mtime: float) -> Optional[Dict[str, any]]:
+    """
+    Return metadata cached next to the PDF, or None if missing or stale.
+    
+    The sidecar is only trusted if the PDF's size and modification time
+    still match the values recorded when it was written.
+    """
+    try:
+        with open(file_path + METADATA_SIDECAR_SUFFIX, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    # A malformed or foreign sidecar is treated like a missing one
+    if not isinstance(record, dict) or not isinstance(record.get('metadata'), dict):
+        return None
+    
+    if record.get('file_size') != file_size or record.get('mtime') != mtime:
+        return None
+    
+    metadata = record['metadata']
+    # The PDF may have been moved along with its sidecar
+    metadata['file_name'] = os.path.basename(file_path)
+    metadata['file_path'] = os.path.abspath(file_path)
+    return metadata
+
+
+def _write_metadata_sidecar(file_path: str, file_size: int, mtime: float,
+                            metadata: Dict[str, any]) -> None:
+    """Save metadata next to the PDF; failures (e.g. read-only dirs) are only logged."""
+    sidecar_path = file_path + METADATA_SIDECAR_SUFFIX
+    record = {'file_size': file_size, 'mtime': mtime, 'metadata': metadata}
+    try:
+        # Write to a temporary file first so readers never see a partial sidecar
+        tmp_path = sidecar_path + '.tmp'
+        with open(tmp_path, 'w', encoding=TEXT_ENCODING) as f:
+            json.dump(record, f, default=str)
+        os.replace(tmp_path, sidecar_path)
+    except OSError as e:
+        logger.warning(f"Could not write metadata sidecar {sidecar_path}: {e}")
+
+
+def get_pdf_metadata(file_path: str, rebuild_meta: bool = False) -> Dict[str, any]:
     """
     Extract metadata information from a PDF file.
     
     Retrieves information like title, author, creation date, etc.
     Useful for document categorization and tracking.
     
+    When ENABLE_METADATA_SIDECAR is set, the result is also saved to
+    '<file_path>.meta.json' and returned from there on later calls without
+    opening the PDF, as long as the file has not changed.
+    
     Args:
         file_path (str): Path to the PDF file
+        rebuild_meta (bool): Ignore any existing sidecar and re-read the PDF
         
     Returns:
         Dict: Dictionary containing PDF metadata:
@@ -233,31 +876,41 @@ def get_pdf_metadata(file_path: str) -> Dict[str, any]:
     """
     try:
         # Validate the file first
-        validate_pdf_file(file_path)
+        st = validate_pdf_file(file_path)
+        
+        file_size = st.st_size
+        mtime = st.st_mtime
+        
+        # Reuse metadata saved by a previous call if the file is unchanged
+        if ENABLE_METADATA_SIDECAR and not rebuild_meta:
+            metadata = _load_metadata_sidecar(file_path, file_size, mtime)
+            if metadata is not None:
+                logger.info(f"Loaded cached metadata for: {file_path}")
+                return metadata
         
         # Open and read the PDF
         logger.info(f"Extracting metadata from: {file_path}")
-        reader = PdfReader(file_path)
-        
-        # Get basic file information
-        metadata = {
-            'file_name': os.path.basename(file_path),
-            'file_path': os.path.abspath(file_path),
-            'file_size_mb': round(os.path.getsize(file_path) / (1024 * 1024), 2),
-            'page_count': len(reader.pages),
-            'is_encrypted': reader.is_encrypted
-        }
-        
-        # Extract PDF metadata if available
-        pdf_metadata = reader.metadata
-        if pdf_metadata:
-            for field in METADATA_FIELDS:
-                # PyPDF2 uses different naming conventions
-                field_key = f'/{field.title().replace("_", "")}'
-                if field_key in pdf_metadata:
-                    metadata[field] = pdf_metadata[field_key]
-                else:
-                    metadata[field] = None
+        doc, lock = _get_reader(file_path, mtime)
+        
+        with lock:
+            # Get basic file information
+            metadata = {
+                'file_name': os.path.basename(file_path),
+                'file_path': os.path.abspath(file_path),
+                'file_size_mb': round(file_size / (1024 * 1024), 2),
+                'page_count': _get_declared_page_count(doc),
+                'is_encrypted': _is_encrypted(doc)
+            }
+            
+            # Extract PDF metadata if available. Index instead of .get():
+            # PyPDF2 only resolves indirect references (e.g. '/Title 5 0 R')
+            # in DictionaryObject.__getitem__
+            pdf_metadata = _get_raw_metadata(doc) or {}
+            for field, field_key in _PDF_META_KEYS:
+                metadata[field] = pdf_metadata[field_key] if field_key in pdf_metadata else None
+        
+        if ENABLE_METADATA_SIDECAR:
+            _write_metadata_sidecar(file_path, file_size, mtime, metadata)
         
         logger.info(f"Successfully extracted metadata: {metadata['page_count']} pages")
         return metadata
@@ -265,19 +918,33 @@ def get_pdf_metadata(file_path: str) -> Dict[str, any]:
     except (FileNotFoundError, ValueError) as e:
         logger.error(f"Error: {e}")
         raise
-    except Exception as e:
+    except _BACKEND_ERRORS as e:
         logger.error(f"Error extracting metadata: {e}")
-        raise Exception(f"Failed to extract metadata: {str(e)}")
+        raise PDFExtractionError(f"Failed to extract metadata: {e}") from e
 
 
 # Example usage (for demonstration)
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="PDF Text Extractor Module")
+    parser.add_argument('--rebuild-meta', nargs='+', metavar='PDF',
+                        help="re-read the given PDFs and rewrite their metadata sidecars")
+    args = parser.parse_args()
+    
+    if args.rebuild_meta:
+        for pdf_path in args.rebuild_meta:
+            pdf_info = get_pdf_metadata(pdf_path, rebuild_meta=True)
+            print(f"Rebuilt {pdf_path}{METADATA_SIDECAR_SUFFIX}: {pdf_info['page_count']} pages")
+        raise SystemExit(0)
+    
     print("PDF Text Extractor Module")
     print("=" * 50)
-    print("\nThis module provides three main functions:")
+    print("\nThis module provides four main functions:")
     print("1. extract_text_from_pdf(file_path) - Extract all text")
     print("2. extract_text_by_pages(file_path) - Extract text per page")
     print("3. get_pdf_metadata(file_path) - Get PDF information")
+    print("4. iter_pages(file_path) - Stream text page by page")
     print("\nExample usage:")
     print(">>> from src.pdf_extractor import extract_text_from_pdf")
     print(">>> text = extract_text_from_pdf('data/sample_pdfs/sample1.pdf')")
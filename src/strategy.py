@@ -0,0 +1,97 @@
+"""
+Extraction Strategy Module
+
+This module decides how the pages of a PDF should be extracted based on
+the document size and the number of available CPUs. Small documents are
+not worth the cost of starting worker processes, while very large ones
+should use every core available.
+
+Strategy table (by page count):
+- tiny   (<= 10):     batch of 5 pages per worker task
+- small  (11 - 50):   batch of 10 pages per worker task
+- medium (51 - 200):  streaming, 200-page windows
+- large  (201 - 500): streaming, 200-page windows
+- xlarge (> 500):     process pool using all workers, coarse chunks
+                      (submitted in 200-page windows, like streaming)
+
+With a native backend (pypdfium2) pages are so cheap to extract in-process
+that tiny and small documents are always extracted sequentially.
+"""
+
+import math
+from typing import NamedTuple, Optional
+
+from .config import MIN_PAGES_FOR_PARALLEL, MIN_PAGES_FOR_PARALLEL_PDFIUM
+
+# Page count upper bounds for each size class
+TINY_MAX_PAGES = 10
+SMALL_MAX_PAGES = 50
+MEDIUM_MAX_PAGES = 200
+LARGE_MAX_PAGES = 500
+
+# Pages submitted per window in streaming mode
+STREAM_CHUNK_SIZE = 200
+
+
+class Strategy(NamedTuple):
+    """
+    Extraction plan for a single document.
+
+    Attributes:
+        name (str): Size class ('tiny', 'small', 'medium', 'large', 'xlarge')
+        mode (str): 'sequential', 'batch', 'stream' or 'process'
+        batch_size (int): Pages per worker task ('batch', 'process') or
+            pages per window ('stream')
+        max_workers (int): Number of worker processes to start
+    """
+    name: str
+    mode: str
+    batch_size: int
+    max_workers: int
+
+
+def choose_strategy(page_count: int, cpu_count: Optional[int], native: bool = False) -> Strategy:
+    """
+    Choose an extraction strategy for a document.
+
+    Args:
+        page_count (int): Number of pages in the PDF
+        cpu_count (int): Number of CPUs available (None is treated as 1)
+        native (bool): Pages are extracted by a native backend (pypdfium2),
+            which raises the page count needed to use a process pool
+
+    Returns:
+        Strategy: The extraction plan to use
+
+    Example:
+        >>> choose_strategy(30, 8)
+        Strategy(name='small', mode='batch', batch_size=10, max_workers=3)
+        >>> choose_strategy(30, 8, native=True)
+        Strategy(name='small', mode='sequential', batch_size=30, max_workers=1)
+    """
+    cpu_count = max(cpu_count or 1, 1)
+
+    if page_count <= TINY_MAX_PAGES:
+        name, mode, batch_size = 'tiny', 'batch', 5
+    elif page_count <= SMALL_MAX_PAGES:
+        name, mode, batch_size = 'small', 'batch', 10
+    elif page_count <= MEDIUM_MAX_PAGES:
+        name, mode, batch_size = 'medium', 'stream', STREAM_CHUNK_SIZE
+    elif page_count <= LARGE_MAX_PAGES:
+        name, mode, batch_size = 'large', 'stream', STREAM_CHUNK_SIZE
+    else:
+        # Coarse chunks: roughly four tasks per worker
+        name, mode = 'xlarge', 'process'
+        batch_size = math.ceil(page_count / (cpu_count * 4))
+
+    if mode == 'batch':
+        max_workers = min(cpu_count, math.ceil(page_count / batch_size))
+    else:
+        max_workers = cpu_count
+
+    # Starting a pool is not worth it for a handful of pages or a single CPU
+    min_pages = MIN_PAGES_FOR_PARALLEL_PDFIUM if native else MIN_PAGES_FOR_PARALLEL
+    if page_count < min_pages or max_workers < 2:
+        return Strategy(name, 'sequential', max(page_count, 1), 1)
+
+    return Strategy(name, mode, batch_size, max_workers)
@@ -14,6 +14,10 @@ Run this script after installing dependencies:
 
 import os
 import sys
+import json
+import shutil
+import tempfile
+import threading
 
 # Add parent directory to path to import src module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -21,9 +25,14 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.pdf_extractor import (
     extract_text_from_pdf,
     extract_text_by_pages,
+    iter_pages,
+    extract_text_batch,
     get_pdf_metadata,
-    validate_pdf_file
+    validate_pdf_file,
+    PDFExtractionError
 )
+from src.strategy import choose_strategy
+import src.pdf_extractor as pdf_extractor
 
 
 def print_header(title):
@@ -33,6 +42,54 @@ def print_header(title):
     print("=" * 70)
 
 
+def write_test_pdf(path, page_texts, corrupt_page=None, info=None):
+    """
+    Write a minimal PDF with one line of text per page (no reportlab needed).
+    
+    The content stream of page index corrupt_page, if given, is replaced by
+    an ASCII85 group that overflows 32 bits (PyPDF2 raises struct.error).
+    Entries of info (e.g. {'Title': ...}) are written to the document info
+    dictionary as indirect objects ('/Title 5 0 R').
+    """
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", None]
+    kids = []
+    for index, text in enumerate(page_texts):
+        content = b"BT /F1 12 Tf 72 720 Td (" + text.encode('latin-1') + b") Tj ET"
+        stream_filter = b""
+        if index == corrupt_page:
+            content, stream_filter = b"uuuuu~>", b" /Filter /ASCII85Decode"
+        objects.append(b"<< /Length %d%s >>\nstream\n%s\nendstream" % (len(content), stream_filter, content))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 1 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % len(kids)
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    root = len(objects)
+    
+    trailer_info = b""
+    if info:
+        entries = []
+        for key, value in info.items():
+            objects.append(b"(" + value.encode('latin-1') + b")")
+            entries.append(b"/%s %d 0 R" % (key.encode('latin-1'), len(objects)))
+        objects.append(b"<< " + b" ".join(entries) + b" >>")
+        trailer_info = b" /Info %d 0 R" % len(objects)
+    
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root %d 0 R%s >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, root, trailer_info, xref_offset)
+    
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
 def test_metadata_extraction():
     """Test PDF metadata extraction"""
     print_header("TEST 1: PDF Metadata Extraction")
@@ -137,6 +194,329 @@ def test_error_handling():
         return False
 
 
+def test_strategy_selection():
+    """Test that the extraction strategy scales with page count"""
+    print_header("TEST 5: Extraction Strategy Selection")
+    
+    expected = [
+        (2, 8, False, 'sequential'),
+        (8, 8, False, 'batch'),
+        (40, 8, False, 'batch'),
+        (120, 8, False, 'stream'),
+        (400, 8, False, 'stream'),
+        (1000, 8, False, 'process'),
+        (1000, 1, False, 'sequential'),
+        (8, 8, True, 'sequential'),
+        (50, 8, True, 'sequential'),
+        (120, 8, True, 'stream'),
+    ]
+    
+    try:
+        for page_count, cpu_count, native, mode in expected:
+            strategy = choose_strategy(page_count, cpu_count, native=native)
+            backend = "native" if native else "PyPDF2"
+            print(f"   - {page_count} pages / {cpu_count} CPUs / {backend}: {strategy.name} ({strategy.mode})")
+            if strategy.mode != mode:
+                print(f"❌ Expected mode '{mode}', got '{strategy.mode}'")
+                return False
+        
+        print("\n✅ Strategies selected correctly")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        return False
+
+
+def test_streaming_extraction():
+    """Test streaming pages with iter_pages"""
+    print_header("TEST 6: Streaming Page Extraction")
+    
+    sample_pdf = "data/sample_pdfs/sample2.pdf"
+    
+    try:
+        print(f"\n📄 Streaming pages from: {sample_pdf}")
+        streamed = list(iter_pages(sample_pdf))
+        pages = extract_text_by_pages(sample_pdf)
+        
+        print(f"   - Pages streamed: {len(streamed)}")
+        if streamed != pages:
+            print("❌ Streamed pages differ from extract_text_by_pages")
+            return False
+        
+        print("\n✅ Streaming extraction matches page-by-page extraction")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        return False
+
+
+def test_metadata_sidecar():
+    """Test that metadata is cached in a sidecar file"""
+    print_header("TEST 7: Metadata Sidecar Cache")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Work on a copy so no sidecar is written next to the sample PDFs
+        sample_pdf = os.path.join(tmp_dir, "sample2.pdf")
+        shutil.copy2("data/sample_pdfs/sample2.pdf", sample_pdf)
+        sidecar = sample_pdf + ".meta.json"
+        
+        try:
+            fresh = get_pdf_metadata(sample_pdf, rebuild_meta=True)
+            if not os.path.exists(sidecar):
+                print(f"❌ Sidecar not written: {sidecar}")
+                return False
+            
+            cached = get_pdf_metadata(sample_pdf)
+            print(f"   - Sidecar: {sidecar}")
+            print(f"   - Page Count (cached): {cached['page_count']}")
+            if cached != fresh:
+                print("❌ Cached metadata differs from fresh metadata")
+                return False
+            
+            # Malformed or foreign sidecars must be ignored, not raise
+            st = os.stat(sample_pdf)
+            malformed = [[], "x", {'file_size': st.st_size, 'mtime': st.st_mtime}]
+            for record in malformed:
+                with open(sidecar, 'w', encoding='utf-8') as f:
+                    json.dump(record, f)
+                if get_pdf_metadata(sample_pdf) != fresh:
+                    print(f"❌ Metadata wrong with malformed sidecar: {record!r}")
+                    return False
+            print(f"   - Ignored {len(malformed)} malformed sidecars")
+            
+            print("\n✅ Metadata sidecar works correctly")
+            return True
+            
+        except Exception as e:
+            print(f"\n❌ Error: {type(e).__name__}: {e}")
+            return False
+
+
+def test_batch_extraction():
+    """Test extracting text from several PDFs at once"""
+    print_header("TEST 8: Batch Extraction")
+    
+    sample_pdfs = ["data/sample_pdfs/sample1.pdf", "data/sample_pdfs/sample2.pdf"]
+    
+    try:
+        print(f"\n📄 Extracting {len(sample_pdfs)} PDFs in one batch")
+        texts = extract_text_batch(sample_pdfs)
+        
+        for sample_pdf in sample_pdfs:
+            print(f"   - {sample_pdf}: {len(texts[sample_pdf])} characters")
+            if texts[sample_pdf] != extract_text_from_pdf(sample_pdf):
+                print(f"❌ Batch text differs for {sample_pdf}")
+                return False
+        
+        print("\n✅ Batch extraction matches single-file extraction")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        return False
+
+
+def test_lazy_extraction():
+    """Test lazy page-by-page extraction"""
+    print_header("TEST 9: Lazy Page Extraction")
+    
+    sample_pdf = "data/sample_pdfs/sample2.pdf"
+    
+    try:
+        print(f"\n📄 Lazily extracting pages from: {sample_pdf}")
+        lazy_pages = extract_text_by_pages(sample_pdf, lazy=True)
+        pages = extract_text_by_pages(sample_pdf)
+        
+        print(f"   - Pages: {len(lazy_pages)}")
+        print(f"   - First page: {lazy_pages[0]['char_count']} characters")
+        for lazy_page, page in zip(lazy_pages, pages):
+            if (lazy_page['page_number'], lazy_page['text']) != (page['page_number'], page['text']):
+                print(f"❌ Lazy page {page['page_number']} differs")
+                return False
+        
+        print("\n✅ Lazy pages match eager extraction")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        return False
+
+
+def test_corrupted_pdf_handling():
+    """Test that unreadable PDFs raise PDFExtractionError and are skipped in batches"""
+    print_header("TEST 10: Corrupted PDF Handling")
+    
+    sample_pdf = "data/sample_pdfs/sample1.pdf"
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corrupted_pdf = os.path.join(tmp_dir, "corrupted.pdf")
+        with open(corrupted_pdf, 'wb') as f:
+            f.write(b"this is not a PDF file")
+        
+        try:
+            extract_text_from_pdf(corrupted_pdf)
+            print("❌ Should have raised PDFExtractionError")
+            return False
+        except PDFExtractionError as e:
+            print(f"✅ Correctly raised PDFExtractionError: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+            return False
+        
+        try:
+            texts = extract_text_batch([sample_pdf, corrupted_pdf])
+        except Exception as e:
+            print(f"❌ Batch should skip corrupted files, got: {e}")
+            return False
+        
+        if corrupted_pdf in texts or sample_pdf not in texts:
+            print("❌ Batch result should contain only the readable PDF")
+            return False
+        
+        print("✅ Batch extraction skipped the corrupted PDF")
+        
+        # A damaged content stream, which PyPDF2 reports with a bare struct.error
+        bad_stream_pdf = os.path.join(tmp_dir, "bad_stream.pdf")
+        write_test_pdf(bad_stream_pdf, ["A readable page", "A damaged page"], corrupt_page=1)
+        
+        original_backend = pdf_extractor.PDF_BACKEND
+        pdf_extractor.PDF_BACKEND = 'pypdf2'
+        pdf_extractor.clear_cache()
+        try:
+            try:
+                extract_text_from_pdf(bad_stream_pdf)
+                print("❌ Should have raised PDFExtractionError for a damaged stream")
+                return False
+            except PDFExtractionError as e:
+                print(f"✅ Correctly raised PDFExtractionError for a damaged stream: {e}")
+            except Exception as e:
+                print(f"❌ Unexpected error: {type(e).__name__}: {e}")
+                return False
+            
+            try:
+                texts = extract_text_batch([sample_pdf, bad_stream_pdf])
+            except Exception as e:
+                print(f"❌ Batch should skip damaged streams, got: {type(e).__name__}: {e}")
+                return False
+        finally:
+            pdf_extractor.PDF_BACKEND = original_backend
+            pdf_extractor.clear_cache()
+        
+        if bad_stream_pdf in texts or sample_pdf not in texts:
+            print("❌ Batch result should contain only the readable PDF")
+            return False
+        
+        print("✅ Batch extraction skipped the PDF with a damaged stream")
+        
+        # Passes the stat-based validation, but cannot be read (EISDIR)
+        directory_pdf = os.path.join(tmp_dir, "directory.pdf")
+        os.mkdir(directory_pdf)
+        try:
+            texts = extract_text_batch([sample_pdf, directory_pdf])
+        except Exception as e:
+            print(f"❌ Batch should skip unreadable paths, got: {type(e).__name__}: {e}")
+            return False
+        
+        if directory_pdf in texts or sample_pdf not in texts:
+            print("❌ Batch result should contain only the readable PDF")
+            return False
+        
+        print("✅ Batch extraction skipped the unreadable path")
+        return True
+
+
+def test_concurrent_extraction():
+    """Test that threads extracting the same (cached) PDF get correct text"""
+    print_header("TEST 11: Concurrent Extraction")
+    
+    num_threads = 4
+    original_backend = pdf_extractor.PDF_BACKEND
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        shared_pdf = os.path.join(tmp_dir, "shared.pdf")
+        page_texts = [f"Page {i} " + "lorem ipsum dolor sit amet " * 20 for i in range(1, 121)]
+        write_test_pdf(shared_pdf, page_texts)
+        
+        try:
+            for backend in ('pypdf2', 'pypdfium2'):
+                pdf_extractor.PDF_BACKEND = backend
+                pdf_extractor.clear_cache()
+                expected_text = extract_text_from_pdf(shared_pdf)
+                expected_pages = [page['text'] for page in extract_text_by_pages(shared_pdf)]
+                pdf_extractor.clear_cache()
+                
+                errors = []
+                barrier = threading.Barrier(num_threads)
+                
+                def worker():
+                    barrier.wait()
+                    try:
+                        for _ in range(3):
+                            if extract_text_from_pdf(shared_pdf) != expected_text:
+                                errors.append("extract_text_from_pdf returned wrong text")
+                            lazy_pages = extract_text_by_pages(shared_pdf, lazy=True)
+                            if [page.text for page in lazy_pages] != expected_pages:
+                                errors.append("lazy pages returned wrong text")
+                    except Exception as e:
+                        errors.append(f"{type(e).__name__}: {e}")
+                
+                print(f"\n🧵 {num_threads} threads extracting with {backend}: {shared_pdf}")
+                threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                
+                if errors:
+                    print(f"❌ {len(errors)} concurrent extraction(s) failed, e.g. {errors[0]}")
+                    return False
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            return False
+        finally:
+            pdf_extractor.PDF_BACKEND = original_backend
+            pdf_extractor.clear_cache()
+        
+        print("✅ All threads extracted the same text")
+        return True
+
+
+def test_indirect_metadata():
+    """Test metadata values stored as indirect objects are resolved"""
+    print_header("TEST 12: Indirect Metadata Values")
+    
+    original_backend = pdf_extractor.PDF_BACKEND
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        indirect_pdf = os.path.join(tmp_dir, "indirect.pdf")
+        write_test_pdf(indirect_pdf, ["Only page"],
+                       info={'Title': 'Indirect Title', 'Author': 'Indirect Author'})
+        
+        try:
+            for backend in ('pypdf2', 'pypdfium2'):
+                pdf_extractor.PDF_BACKEND = backend
+                pdf_extractor.clear_cache()
+                fresh = get_pdf_metadata(indirect_pdf, rebuild_meta=True)
+                cached = get_pdf_metadata(indirect_pdf)
+                
+                print(f"   - {backend}: title={fresh['title']!r}, author={fresh['author']!r}")
+                for metadata in (fresh, cached):
+                    if (metadata['title'], metadata['author']) != ('Indirect Title', 'Indirect Author'):
+                        print(f"❌ Indirect values not resolved with {backend}")
+                        return False
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            return False
+        finally:
+            pdf_extractor.PDF_BACKEND = original_backend
+            pdf_extractor.clear_cache()
+        
+        print("\n✅ Indirect metadata values resolved correctly")
+        return True
+
+
 def run_all_tests():
     """Run all tests and display summary"""
     print("\n" + "🧪" * 35)
@@ -156,6 +536,14 @@ def run_all_tests():
     results.append(("Full Text Extraction", test_full_text_extraction()))
     results.append(("Page-by-Page Extraction", test_page_by_page_extraction()))
     results.append(("Error Handling", test_error_handling()))
+    results.append(("Strategy Selection", test_strategy_selection()))
+    results.append(("Streaming Extraction", test_streaming_extraction()))
+    results.append(("Metadata Sidecar", test_metadata_sidecar()))
+    results.append(("Batch Extraction", test_batch_extraction()))
+    results.append(("Lazy Extraction", test_lazy_extraction()))
+    results.append(("Corrupted PDF Handling", test_corrupted_pdf_handling()))
+    results.append(("Concurrent Extraction", test_concurrent_extraction()))
+    results.append(("Indirect Metadata", test_indirect_metadata()))
     
     # Print summary
     print_header("TEST SUMMARY")